@@ -8,17 +8,26 @@
 # - Default view is JPT-only (toggle others in Sources)
 # - Robust against missing columns / empty files
 # - NEVER uses shared list defaults (prevents “all tags/topics on every card” bug)
+# - Normalized sources are cached as Parquet sidecars next to each CSV
+#   (<name>.<mtime_ns>.<size>.v<NORMALIZE_VERSION>-<tags mtime_ns>-<tags size>.parquet)
 
 from __future__ import annotations
 
 import ast
 import html
+import json
 import re
+import sys
+from dataclasses import dataclass
+from functools import cached_property, lru_cache
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Set
+from typing import Dict, FrozenSet, List, Set, Tuple
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
 import streamlit as st
 
 
@@ -29,6 +38,7 @@ JPT_PATH = Path("jpt_scraper/data/jpt.csv")
 WORLDOIL_PATH = Path("jpt_scraper/data/worldoil.csv")
 OILPRICE_PATH = Path("jpt_scraper/data/oilprice.csv")
 ALL_TAGS_PATH = Path("all_tags.csv")  # must contain column: tag
+NORMALIZE_VERSION = 1  # bump whenever normalize_source output changes (invalidates the Parquet sidecars)
 
 DEFAULT_SOURCES = ["JPT", "WorldOil", "OilPrice"]  # All sources selected by default
 PREFER_JPT_ON_TIES = True          # tie-breaker for same-date items
@@ -39,6 +49,18 @@ PAGE_SIZE_DEFAULT_INDEX = 3        # 100
 # Normalization
 # -------------------
 WORD_SPLIT_RE = re.compile(r"(\s+|[-/])")  # keep separators
+_WS_RE = re.compile(r"\s+")
+_ACR_ALNUM_RE = re.compile(r"[A-Za-z]{1,4}\d{1,3}")
+_ACR_ALLCAPS_RE = re.compile(r"[A-Z]{2,}")
+_HAS_AMP_DOT_RE = re.compile(r"[&.]")
+_HAS_ALPHA_RE = re.compile(r"[A-Za-z]")
+_ACR_MIX_RE = re.compile(r"[A-Z0-9&./-]{2,}")
+_HAS_UPPER_RE = re.compile(r"[A-Z]")
+# Flat list of plain quoted strings (no escapes), e.g. "['LNG', 'Qatar']": items can be read off with findall
+_QUOTED_ITEM = r"(?:'[^'\\]*'|\"[^\"\\]*\")"
+_FLAT_LIST_RE = re.compile(rf"\[\s*{_QUOTED_ITEM}(?:\s*,\s*{_QUOTED_ITEM})*\s*,?\s*\]")
+_LIST_ITEM_RE = re.compile(r"'([^'\\]*)'|\"([^\"\\]*)\"")
+_META_DATE_RE = re.compile(r"([A-Z][a-z]{2}\s\d{1,2},\s\d{4})")  # "Mar 4, 2026" in OilPrice meta_info
 
 BASE_ACRONYMS = {
     "AI", "ML", "US", "UK", "UAE", "LNG", "CCS", "CO2", "CO₂", "M&A", "HSE", "OPEC",
@@ -63,6 +85,11 @@ def _normalize_text(x) -> str:
     return " ".join(str(x).split()).strip()
 
 
+def _normalize_text_series(s: pd.Series) -> pd.Series:
+    """Vectorized _normalize_text for whole columns."""
+    return s.fillna("").astype(str).str.replace(_WS_RE, " ", regex=True).str.strip()
+
+
 def _parse_listish(value) -> list[str]:
     """Accepts list, python-list-string, or comma-separated string."""
     if value is None or (isinstance(value, float) and pd.isna(value)):
@@ -75,33 +102,55 @@ def _parse_listish(value) -> list[str]:
         return []
 
     if s.startswith("[") and s.endswith("]"):
+        # JSON first (C decoder), then flat Python-repr lists via regex; only anything else pays for an AST parse
         try:
-            parsed = ast.literal_eval(s)
-            if isinstance(parsed, list):
-                return [str(v).strip() for v in parsed if str(v).strip()]
-        except Exception:
-            pass
+            parsed = json.loads(s)
+        except ValueError:
+            if _FLAT_LIST_RE.fullmatch(s):
+                parsed = [a or b for a, b in _LIST_ITEM_RE.findall(s)]
+            else:
+                try:
+                    parsed = ast.literal_eval(s)
+                except Exception:
+                    parsed = None
+        if isinstance(parsed, list):
+            return [str(v).strip() for v in parsed if str(v).strip()]
 
     return [p.strip() for p in s.split(",") if p.strip()]
 
 
-def _looks_like_acronym(token: str, acronyms: Set[str]) -> bool:
+def _parse_listish_series(s: pd.Series) -> pd.Series:
+    """
+    Column-wise _parse_listish: plain comma-separated cells (the CSV norm) are split in one
+    str.split pass; only bracketed cells go through the per-cell parser.
+    Pieces are left unstripped (may be blank): tag/topic normalization strips and drops them.
+    """
+    text = s.where(s.notna(), "").astype(str).str.strip()
+    parsed = text.str.split(",")
+    bracketed = text.str.startswith("[") & text.str.endswith("]")
+    if bracketed.any():
+        parsed = parsed.where(~bracketed, text[bracketed].map(_parse_listish))
+    return parsed
+
+
+def _looks_like_acronym(token: str, acronyms: FrozenSet[str]) -> bool:
     if not token:
         return False
     t = token.strip()
 
     if t.upper() in acronyms:
         return True
-    if re.fullmatch(r"[A-Za-z]{1,4}\d{1,3}", t):
+    if _ACR_ALNUM_RE.fullmatch(t):
         return True
-    if re.fullmatch(r"[A-Z]{2,}", t):
+    if _ACR_ALLCAPS_RE.fullmatch(t):
         return True
-    if re.search(r"[&.]", t) and re.search(r"[A-Za-z]", t):
+    if _HAS_AMP_DOT_RE.search(t) and _HAS_ALPHA_RE.search(t):
         return True
     return False
 
 
-def _smart_title_token(token: str, acronyms: Set[str]) -> str:
+@lru_cache(maxsize=4096)
+def _smart_title_token(token: str, acronyms: FrozenSet[str]) -> str:
     raw = token.strip()
     if not raw:
         return token
@@ -120,19 +169,25 @@ def _smart_title_token(token: str, acronyms: Set[str]) -> str:
     return raw[:1].upper() + raw[1:].lower()
 
 
-def normalize_phrase(s: str, acronyms: Set[str]) -> str:
+@lru_cache(maxsize=4096)
+def normalize_phrase(s: str, acronyms: FrozenSet[str]) -> str:
     s = _normalize_text(s)
     if not s:
         return ""
     parts = WORD_SPLIT_RE.split(s)
     out = "".join(_smart_title_token(p, acronyms) for p in parts)
-    out = re.sub(r"\s+", " ", out).strip()
+    out = _WS_RE.sub(" ", out).strip()
     out = out.replace("Co2", "CO2").replace("Co₂", "CO2")
     return out
 
 
+@lru_cache(maxsize=64)
+def _columns_by_lower(columns: Tuple[str, ...]) -> Dict[str, str]:
+    return {c.lower(): c for c in columns}
+
+
 def pick_col(df: pd.DataFrame, candidates: List[str]) -> str | None:
-    cols_lower = {c.lower(): c for c in df.columns}
+    cols_lower = _columns_by_lower(tuple(df.columns))  # built once per schema, not per call
     for cand in candidates:
         if cand.lower() in cols_lower:
             return cols_lower[cand.lower()]
@@ -151,20 +206,21 @@ def load_master_tags(path: Path) -> List[str]:
     return [_normalize_text(x) for x in df["tag"].tolist() if _normalize_text(x)]
 
 
-def build_acronym_set(master_tags: List[str]) -> Set[str]:
+def build_acronym_set(master_tags: List[str]) -> FrozenSet[str]:
     acronyms = set(BASE_ACRONYMS)
     for t in master_tags:
         t = _normalize_text(t)
         if not t:
             continue
-        if re.fullmatch(r"[A-Z0-9&./-]{2,}", t) and re.search(r"[A-Z]", t):
+        if _ACR_MIX_RE.fullmatch(t) and _HAS_UPPER_RE.search(t):
             acronyms.add(t.upper())
-        if re.search(r"[&.]", t) and re.search(r"[A-Za-z]", t):
+        if _HAS_AMP_DOT_RE.search(t) and _HAS_ALPHA_RE.search(t):
             acronyms.add(t.upper())
-    return acronyms
+    # frozen so it can key the lru_caches on normalize_phrase / _smart_title_token
+    return frozenset(acronyms)
 
 
-def build_canonical_tag_map(master_tags: List[str], acronyms: Set[str]) -> Dict[str, str]:
+def build_canonical_tag_map(master_tags: List[str], acronyms: FrozenSet[str]) -> Dict[str, str]:
     m: Dict[str, str] = {}
     for t in master_tags:
         key = _normalize_text(t).lower()
@@ -177,7 +233,7 @@ def build_canonical_tag_map(master_tags: List[str], acronyms: Set[str]) -> Dict[
 # Countries
 # -------------------
 @st.cache_resource
-def build_country_set_cached() -> Set[str]:
+def build_country_set_cached() -> FrozenSet[str]:
     out: Set[str] = {"US", "UK", "UAE"}
     try:
         import pycountry  # type: ignore
@@ -194,45 +250,305 @@ def build_country_set_cached() -> Set[str]:
             "Saudi Arabia", "Qatar", "Kuwait", "Iraq", "Iran", "Oman", "Egypt", "Nigeria",
             "Malaysia", "Greece",
         }
-    return out
+    return frozenset(out)
 
 
-def extract_countries_from_tags(tags: List[str], country_set: Set[str]) -> List[str]:
-    out: Set[str] = set()
-    for t in tags:
-        t_norm = _normalize_text(t)
-        if not t_norm:
-            continue
+def country_of_tag(tag: str, country_set: FrozenSet[str]) -> str | None:
+    t_norm = _normalize_text(tag)
+    if not t_norm:
+        return None
 
-        if t_norm in COUNTRY_ABBREV:
-            out.add(COUNTRY_ABBREV[t_norm])
-            continue
+    if t_norm in COUNTRY_ABBREV:
+        return COUNTRY_ABBREV[t_norm]
 
-        if t_norm in country_set:
-            out.add(t_norm)
-            continue
+    if t_norm in country_set:
+        return t_norm
+
+    up = t_norm.upper()
+    if up in {"US", "UK", "UAE"}:
+        return up
+    return None
 
-        up = t_norm.upper()
-        if up in {"US", "UK", "UAE"}:
-            out.add(up)
 
-    return sorted(out)
+def extract_countries(tag_lists: pd.Series, country_set: FrozenSet[str]) -> pd.Series:
+    """Per-row sorted country lists, resolved once per distinct tag and joined back via explode/map."""
+    flat = tag_lists.explode().dropna()
+    lookup = {t: c for t in flat.unique() if (c := country_of_tag(t, country_set))}
+    hits = flat.map(lookup).dropna()
+    per_row = hits.groupby(level=0).agg(lambda xs: sorted(set(xs))).reindex(tag_lists.index)
+    return pd.Series([xs if isinstance(xs, list) else [] for xs in per_row], index=tag_lists.index)
 
 
 # -------------------
-# Data loading (cache keyed by mtime)
+# Data loading (normalized sources; memory cache + Parquet sidecar keyed by CSV mtime+size)
 # -------------------
+SOURCE_RANK = {"JPT": 0, "WorldOil": 1, "OilPrice": 2}
+LIST_COLUMNS = ["tags_norm", "topics_norm", "countries"]
+SEARCH_SEP = "\x1f"
+
+# Raw columns normalize_source reads; any other CSV column is skipped at read time
+TITLE_CANDIDATES = ["title", "headline"]
+PUBLISHED_CANDIDATES = ["published_date", "published", "date"]
+SCRAPED_CANDIDATES = ["scraped_at"]
+TAGS_CANDIDATES = ["tags", "tag"]
+TOPICS_CANDIDATES = ["topics", "topic"]
+META_CANDIDATES = ["meta_info"]
+# ... of which these the UI still reads after normalization (everything else is projected away)
+URL_CANDIDATES = ["url", "link", "article_url"]
+EXCERPT_CANDIDATES = ["excerpt", "summary", "description", "deck", "teaser", "subtitle"]
+COMPANY_CANDIDATES = ["company_name", "company"]
+SOURCE_COLUMNS = frozenset(
+    c.lower()
+    for cands in (
+        TITLE_CANDIDATES, PUBLISHED_CANDIDATES, SCRAPED_CANDIDATES, TAGS_CANDIDATES, TOPICS_CANDIDATES,
+        META_CANDIDATES, URL_CANDIDATES, EXCERPT_CANDIDATES, COMPANY_CANDIDATES,
+    )
+    for c in cands
+)
+DERIVED_COLUMNS = [
+    "source", "title_norm", "source_norm", *LIST_COLUMNS,
+    "published_dt", "scraped_dt", "_source_rank", "_search_text",
+]
+
+
+def _projected_columns(df: pd.DataFrame) -> List[str]:
+    """Columns normalize_source keeps: the raw ones the UI renders plus the derived ones."""
+    raw_cols = (
+        pick_col(df, URL_CANDIDATES),
+        pick_col(df, EXCERPT_CANDIDATES),
+        pick_col(df, COMPANY_CANDIDATES),
+        pick_col(df, SCRAPED_CANDIDATES),
+    )
+    return list(dict.fromkeys([c for c in raw_cols if c] + DERIVED_COLUMNS))
+
+
+def _file_token(path: Path) -> Tuple[int, int]:
+    """(mtime_ns, size): changes exactly when the file is rewritten; (0, 0) if missing."""
+    if not path.exists():
+        return (0, 0)
+    s = path.stat()
+    return (s.st_mtime_ns, s.st_size)
+
+
+def _assets_token() -> Tuple[int, Tuple[int, int]]:
+    """Everything besides the CSV a sidecar depends on: normalization code version + master tag file."""
+    return (NORMALIZE_VERSION, _file_token(ALL_TAGS_PATH))
+
+
+def _assets_tag(assets: Tuple[int, Tuple[int, int]]) -> str:
+    version, (tags_mtime_ns, tags_size) = assets
+    return f"v{version}-{tags_mtime_ns}-{tags_size}"
+
+
+def _cached_parquet_path(csv_path: Path, assets: Tuple[int, Tuple[int, int]]) -> Path:
+    mtime_ns, size = _file_token(csv_path)
+    return csv_path.with_suffix(f".{mtime_ns}.{size}.{_assets_tag(assets)}.parquet")
+
+
+def _remove_stale_parquet(csv_path: Path, keep: Path) -> None:
+    for p in csv_path.parent.glob(f"{csv_path.stem}.*.parquet"):
+        if p != keep:
+            p.unlink(missing_ok=True)
+
+
+def _latest_parquet(csv_path: Path, assets: Tuple[int, Tuple[int, int]], exclude: Path) -> Path | None:
+    """
+    Most recent sidecar left over from an earlier version of the CSV, if any. Only sidecars built
+    from the same `assets` (code version + master tags) qualify: their rows are still correct.
+    """
+    pattern = f"{csv_path.stem}.*.{_assets_tag(assets)}.parquet"
+    stale = [p for p in csv_path.parent.glob(pattern) if p != exclude]
+    return max(stale, key=lambda p: p.stat().st_mtime_ns, default=None)
+
+
+def _read_parquet_sidecar(path: Path) -> pd.DataFrame:
+    df = pd.read_parquet(path)
+    for col in LIST_COLUMNS:
+        # pyarrow hands list<string> back as ndarrays of fresh str objects; intern so repeats share one
+        df[col] = df[col].map(lambda xs: [sys.intern(x) for x in xs])
+    df["_search_text"] = df["_search_text"].astype("string[pyarrow]")  # metadata only records "string"
+    return df
+
+
+def _row_keys(df: pd.DataFrame) -> pd.Series | None:
+    """url + scraped_at identifies one scrape of one article; None if either column is missing."""
+    col_url = pick_col(df, URL_CANDIDATES)
+    col_scraped = pick_col(df, SCRAPED_CANDIDATES)
+    if not col_url or not col_scraped:
+        return None
+    return df[col_url].astype(str) + SEARCH_SEP + df[col_scraped].astype(str)
+
+
+def _normalize_incremental(raw: pd.DataFrame, previous: Path, normalize) -> pd.DataFrame:
+    """Normalize only the rows of `raw` not already present in the `previous` sidecar (CSV row order kept)."""
+    try:
+        prev = _read_parquet_sidecar(previous)
+    except Exception:
+        return normalize(raw)
+
+    raw_keys, prev_keys = _row_keys(raw), _row_keys(prev)
+    if raw_keys is None or prev_keys is None or list(prev.columns) != _projected_columns(raw):
+        return normalize(raw)
+
+    prev = prev.set_axis(prev_keys.to_numpy())
+    prev = prev[~prev.index.duplicated(keep="last")]
+    reused = raw_keys.isin(prev.index).to_numpy()
+    if not reused.any():
+        return normalize(raw)
+
+    parts = [prev.loc[raw_keys[reused].to_numpy()].set_axis(raw.index[reused])]
+    if not reused.all():
+        parts.append(normalize(raw[~reused].copy()))
+    df = pd.concat(parts).loc[raw.index]
+    df["_search_text"] = df["_search_text"].astype("string[pyarrow]")
+    return df.reset_index(drop=True)
+
+
+def normalize_source(
+    df: pd.DataFrame,
+    label: str,
+    acronyms: FrozenSet[str],
+    canonical_map: Dict[str, str],
+    country_set: FrozenSet[str],
+) -> pd.DataFrame:
+    """
+    Adds the derived *_norm / *_dt columns the UI filters and renders from.
+    Works in place on `df` (a frame fresh from read_csv) and returns the projected result.
+    """
+    df["source"] = label  # force source labels so none “disappears”
+
+    col_title = pick_col(df, TITLE_CANDIDATES) or "title"
+    col_published = pick_col(df, PUBLISHED_CANDIDATES)
+    col_scraped = pick_col(df, SCRAPED_CANDIDATES)
+    col_tags = pick_col(df, TAGS_CANDIDATES) or "tags"
+    col_topics = pick_col(df, TOPICS_CANDIDATES) or "topics"
+    col_meta = pick_col(df, META_CANDIDATES)
+    col_url = pick_col(df, URL_CANDIDATES)
+    col_excerpt = pick_col(df, EXCERPT_CANDIDATES)
+    col_company = pick_col(df, COMPANY_CANDIDATES)
+
+    # Ensure minimal columns exist
+    ensure_column(df, col_title, "str")
+    ensure_column(df, col_tags, "list")
+    ensure_column(df, col_topics, "list")
+
+    # Normalize each distinct tag/topic once, then rebuild the per-row lists via dict lookups.
+    # Results are interned so every row (and every source) holding a label shares one str object.
+    def normalize_tag(t: str):
+        raw = _normalize_text(t)
+        if not raw:
+            return None
+        key = raw.lower()
+        if key in canonical_map:
+            return sys.intern(canonical_map[key])
+        return sys.intern(normalize_phrase(raw, acronyms))
+
+    def normalize_topic(t: str):
+        raw = _normalize_text(t)
+        return sys.intern(normalize_phrase(raw, acronyms)) if raw else None
+
+    def normalize_lists(lists: pd.Series, normalize_one) -> pd.Series:
+        norm_map = {u: normalize_one(u) for u in lists.explode().dropna().unique()}
+
+        def rebuild(xs: List[str]) -> List[str]:
+            # lookup + drop blanks + order-preserving dedupe in one dict.fromkeys pass
+            return list(dict.fromkeys(y for x in xs if (y := norm_map[x]) is not None))
+
+        return lists.map(rebuild)
+
+    df["tags_norm"] = normalize_lists(_parse_listish_series(df[col_tags]), normalize_tag)
+    df["topics_norm"] = normalize_lists(_parse_listish_series(df[col_topics]), normalize_topic)
+    df["countries"] = extract_countries(df["tags_norm"], country_set)
+
+    df["source_norm"] = normalize_phrase(label, acronyms)
+    df["title_norm"] = _normalize_text_series(df[col_title])
+
+    # Lowercased search haystack; the separator keeps matches from spanning two fields.
+    # Joined and lowered in Arrow (no intermediate Python-object string columns), and kept
+    # Arrow-backed so str.contains runs as pyarrow.compute.match_substring.
+    fields = [pa.array(df[c], from_pandas=True).cast(pa.string()) for c in ("title_norm", col_excerpt, col_company) if c]
+    haystack = pc.binary_join_element_wise(*fields, SEARCH_SEP, null_handling="replace", null_replacement="")
+    df["_search_text"] = pd.Series(pc.utf8_lower(haystack), index=df.index, dtype="string[pyarrow]")
+
+    # --- Date Extraction Logic ---
+    # Explicit formats keep parsing on pandas' C path (no per-column format guessing from the first value)
+    df["published_dt"] = (
+        pd.to_datetime(df[col_published], format="ISO8601", errors="coerce") if col_published else pd.NaT
+    )
+
+    # Fallback: Extract from meta_info if published_dt is missing
+    if col_meta:
+        extracted_dates = df[col_meta].astype(str).str.extract(_META_DATE_RE)[0]
+        fallback_dt = pd.to_datetime(extracted_dates, format="%b %d, %Y", errors="coerce")
+        df["published_dt"] = df["published_dt"].fillna(fallback_dt)
+
+    df["scraped_dt"] = (
+        pd.to_datetime(df[col_scraped], format="ISO8601", errors="coerce", utc=True) if col_scraped else pd.NaT
+    )
+    # Tie-breaker rank: JPT=0, WorldOil=1, OilPrice=2
+    df["_source_rank"] = SOURCE_RANK.get(label, 9) if PREFER_JPT_ON_TIES else 0
+
+    # Project to what the UI reads, so raw tag/topic/meta text never reaches the sidecar or the cache
+    return df[_projected_columns(df)]
+
+
+@st.cache_resource(show_spinner=False)
+def load_normalization_assets(tags_token: Tuple[int, int]) -> Tuple[FrozenSet[str], Dict[str, str]]:
+    """Acronym set + canonical tag map, shared by all sources; `tags_token` (master tag file) is the cache key."""
+    master_tags = load_master_tags(ALL_TAGS_PATH)
+    acronyms = build_acronym_set(master_tags)
+    return acronyms, build_canonical_tag_map(master_tags, acronyms)
+
+
 @st.cache_data(show_spinner=False)
-def load_csv_cached(path_str: str, mtime: float) -> pd.DataFrame:
+def load_source_cached(
+    path_str: str, label: str, token: Tuple[int, int], assets: Tuple[int, Tuple[int, int]]
+) -> pd.DataFrame:
+    """Normalized source; `token` (the CSV) and `assets` (code version + master tags) are the cache key."""
     path = Path(path_str)
     if not path.exists():
         return pd.DataFrame()
-    return pd.read_csv(path)
 
+    parquet_path = _cached_parquet_path(path, assets)
+    if parquet_path.exists():
+        try:
+            return _read_parquet_sidecar(parquet_path)
+        except Exception:
+            # Unreadable (e.g. truncated by an interrupted write): drop it and re-normalize below
+            parquet_path.unlink(missing_ok=True)
+
+    # Multithreaded Arrow parser, restricted to the columns normalization reads (the pyarrow
+    # engine needs usecols as names, so the header is peeked first)
+    header = pd.read_csv(path, nrows=0).columns
+    raw = pd.read_csv(path, engine="pyarrow", usecols=[c for c in header if c.lower() in SOURCE_COLUMNS])
+    if raw.empty:
+        return raw
+
+    acronyms, canonical_map = load_normalization_assets(assets[1])
 
-def load_csv(path: Path) -> pd.DataFrame:
-    mtime = path.stat().st_mtime if path.exists() else 0.0
-    return load_csv_cached(str(path), mtime)
+    def normalize(frame: pd.DataFrame) -> pd.DataFrame:
+        return normalize_source(frame, label, acronyms, canonical_map, build_country_set_cached())
+
+    # Incremental: the merge scripts only add or replace rows, so rows already normalized in the
+    # previous sidecar are reused and only new/re-scraped ones go through normalize_source
+    previous = _latest_parquet(path, assets, exclude=parquet_path)
+    df = _normalize_incremental(raw, previous, normalize) if previous else normalize(raw)
+
+    # Best effort: a read-only checkout still works, it just re-normalizes on the next cold start.
+    # Written next to the sidecar and renamed into place, so a killed write never leaves a
+    # truncated file under the name the fast path reads
+    tmp = parquet_path.with_suffix(".parquet.tmp")
+    try:
+        _remove_stale_parquet(path, keep=parquet_path)
+        df.to_parquet(tmp, engine="pyarrow", compression="zstd", index=False)
+        tmp.replace(parquet_path)
+    except Exception:
+        tmp.unlink(missing_ok=True)
+    return df
+
+
+def load_source(path: Path, label: str) -> pd.DataFrame:
+    return load_source_cached(str(path), label, _file_token(path), _assets_token())
 
 
 def safe_mtime(path: Path) -> datetime | None:
@@ -242,9 +558,9 @@ def safe_mtime(path: Path) -> datetime | None:
 
 
 def latest_scraped_at(df: pd.DataFrame) -> datetime | None:
-    if df.empty or "scraped_at" not in df.columns:
+    if df.empty or "scraped_dt" not in df.columns:
         return None
-    s = pd.to_datetime(df["scraped_at"], errors="coerce").dropna()
+    s = df["scraped_dt"].dropna()  # parsed once in normalize_source
     if s.empty:
         return None
     return s.max().to_pydatetime()
@@ -262,16 +578,125 @@ def compute_last_updated_banner(jpt_df: pd.DataFrame, wo_df: pd.DataFrame, op_df
     return f"**Last updated:** file mtime = {mtime_str} | latest scraped_at = {latest_str}"
 
 
+@st.cache_resource(show_spinner=False, max_entries=1)
+def build_dataframe(token: Tuple[Tuple[int, int], ...]) -> Tuple[pd.DataFrame, str]:
+    """
+    All sources concatenated, plus the "last updated" banner; `token` (source + master tag file tokens)
+    is the cache key, and only the current data version is kept.
+    Shared across reruns and sessions without copying, so callers must treat the frame as read-only.
+    """
+    # Load sources (separate merged outputs, normalized + cached per source)
+    jpt = load_source(JPT_PATH, "JPT")
+    wo = load_source(WORLDOIL_PATH, "WorldOil")
+    op = load_source(OILPRICE_PATH, "OilPrice")
+
+    df = pd.concat([jpt, wo, op], ignore_index=True)
+    banner = compute_last_updated_banner(jpt, wo, op)
+    if df.empty:
+        return df, banner
+
+    ensure_column(df, pick_col(df, URL_CANDIDATES) or "url", "str")
+    ensure_column(df, "source", "str")  # forced in normalize_source
+
+    # Ensure derived cols exist (safety) once on the fresh concat, so filtered views never need a copy
+    for col, kind in [
+        ("tags_norm", "list"),
+        ("topics_norm", "list"),
+        ("countries", "list"),
+        ("title_norm", "str"),
+        ("source_norm", "str"),
+        ("published_dt", "dt"),
+        ("scraped_dt", "dt"),
+        ("_source_rank", "str"),  # harmless if missing
+        ("_search_text", "str"),
+    ]:
+        ensure_column(df, col, kind)
+
+    # A handful of labels over every row: the per-rerun source isin() becomes a lookup on small int codes
+    df["source_norm"] = df["source_norm"].astype("category")
+    return df, banner
+
+
 # -------------------
 # Filter helpers
 # -------------------
-def match_list(values: List[str], selected: List[str], mode: str) -> bool:
+@dataclass(frozen=True)
+class ListIndex:
+    """Sparse rows × labels incidence of a list column, stored column-major (CSC) over categorical codes."""
+
+    categories: pd.Index  # sorted unique labels; a label's position is its code
+    col_ptr: np.ndarray   # rows holding code j are col_rows[col_ptr[j]:col_ptr[j + 1]]
+    col_rows: np.ndarray  # int32 row positions
+    n_rows: int
+
+    @cached_property
+    def values(self) -> List[str]:
+        # Built once per cached index; the unfiltered sidebar options reuse it on every rerun
+        return self.categories.tolist()
+
+
+def build_list_index(lists: pd.Series) -> ListIndex:
+    lengths = lists.str.len().fillna(0).astype(np.int64).to_numpy()
+    rows = np.repeat(np.arange(len(lists), dtype=np.int32), lengths)
+
+    # Long form, dict-encoded: one small int code per (row, label) pair instead of a Python string
+    long_form = pd.Categorical(lists.explode().dropna().astype(str))
+    codes = long_form.codes.astype(np.int32)
+
+    order = np.argsort(codes, kind="stable")
+    counts = np.bincount(codes, minlength=len(long_form.categories))
+    return ListIndex(
+        categories=long_form.categories,
+        col_ptr=np.concatenate(([0], np.cumsum(counts))).astype(np.int32),
+        col_rows=rows[order],
+        n_rows=len(lists),
+    )
+
+
+@st.cache_resource(show_spinner=False, max_entries=1)
+def build_filter_indexes(_df: pd.DataFrame, token: Tuple[Tuple[int, int], ...]) -> Dict[str, ListIndex]:
+    """One incidence index per list column; `token` (source + master tag file tokens) is the cache key."""
+    return {col: build_list_index(_df[col]) for col in LIST_COLUMNS}
+
+
+def available_values(index: ListIndex, row_mask: np.ndarray) -> List[str]:
+    """Sorted labels present in at least one masked row (the cached label list when nothing is masked out)."""
+    if row_mask.all():
+        return index.values
+    if index.categories.empty:
+        return []
+    present = np.logical_or.reduceat(row_mask[index.col_rows], index.col_ptr[:-1])
+    return index.categories[present].tolist()
+
+
+def match_list_mask(index: ListIndex, selected: List[str], mode: str) -> np.ndarray:
+    """Row mask: rows holding any (OR) / all (AND) of the selected labels."""
     if not selected:
-        return True
-    s = set(values or [])
-    if mode == "AND":
-        return all(x in s for x in selected)
-    return any(x in s for x in selected)
+        return np.ones(index.n_rows, dtype=bool)
+    codes = index.categories.get_indexer(selected)
+    cols = codes[codes >= 0].tolist()
+    if mode == "AND" and len(cols) < len(selected):
+        return np.zeros(index.n_rows, dtype=bool)
+    if not cols:
+        return np.zeros(index.n_rows, dtype=bool)
+
+    rows = np.concatenate([index.col_rows[index.col_ptr[c] : index.col_ptr[c + 1]] for c in cols])
+    hits = np.bincount(rows, minlength=index.n_rows)
+    return hits == len(cols) if mode == "AND" else hits > 0
+
+
+def _newest_first(s: pd.Series) -> np.ndarray:
+    # Bitwise NOT reverses int64 order, and maps NaT (min int64) to max, i.e. last
+    return ~pd.to_datetime(s, errors="coerce").array.asi8
+
+
+def newest_first_order(frame: pd.DataFrame) -> np.ndarray:
+    """Positions ordering rows by published_dt desc, source rank, scraped_dt desc (NaT last, ties stable)."""
+    keys = [_newest_first(frame["scraped_dt"])]
+    if PREFER_JPT_ON_TIES and "_source_rank" in frame.columns:
+        keys.append(frame["_source_rank"].to_numpy())
+    keys.append(_newest_first(frame["published_dt"]))
+    return np.lexsort(keys)  # one stable sort over all keys; the last key is the primary one
 
 
 def truncate(s: str, n: int) -> str:
@@ -281,6 +706,14 @@ def truncate(s: str, n: int) -> str:
     return s if len(s) <= n else s[: n - 1].rstrip() + "…"
 
 
+# Same replacements as html.escape(quote=True), applied column-wide via str.translate
+_HTML_ESCAPE_TABLE = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;", "'": "&#x27;"})
+
+
+def _escape_html_series(s: pd.Series) -> pd.Series:
+    return s.str.translate(_HTML_ESCAPE_TABLE)
+
+
 def chip_row(items: List[str]) -> str:
     if not items:
         return ""
@@ -319,121 +752,107 @@ def ensure_column(frame: pd.DataFrame, col: str, kind: str) -> None:
         frame[col] = ""
 
 
+@st.cache_data(show_spinner=False, max_entries=64)
+def render_page_cards(
+    _page_df: pd.DataFrame,
+    page_key: Tuple,
+    col_url: str,
+    col_excerpt: str | None,
+    col_company: str | None,
+    show_excerpt: bool,
+    excerpt_len: int,
+) -> List[str]:
+    """Card HTML for one page of results; `page_key` (data token + row ids) stands in for the frame in the cache key."""
+    # Title/link blocks for the whole page in one pass of vectorized string ops
+    urls_html = _escape_html_series(_normalize_text_series(_page_df[col_url]))
+    titles_html = _escape_html_series(_normalize_text_series(_page_df["title_norm"]).replace("", "Untitled"))
+    linked = (
+        '<div class="news-title"><a href="' + urls_html + '" target="_blank" rel="noopener noreferrer">'
+        + titles_html + "</a></div>"
+    )
+    unlinked = '<div class="news-title">' + titles_html + "</div>"
+    title_blocks = linked.where(urls_html != "", unlinked)
+
+    # Plain per-column lists zipped below: no per-row Series boxing as with iterrows()
+    n = len(_page_df)
+    has_company = bool(col_company) and col_company in _page_df.columns
+    has_excerpt = show_excerpt and bool(col_excerpt) and col_excerpt in _page_df.columns
+    columns = zip(
+        title_blocks.tolist(),
+        _page_df["source_norm"].tolist(),
+        _page_df[col_company].tolist() if has_company else [""] * n,
+        _page_df["published_dt"].tolist(),
+        _page_df[col_excerpt].tolist() if has_excerpt else [""] * n,
+        _page_df["topics_norm"].tolist(),
+        _page_df["tags_norm"].tolist(),
+        _page_df["countries"].tolist(),
+    )
+
+    cards: List[str] = []
+    for title_block, source, company, published, excerpt, topics, tags, countries in columns:
+        source = _normalize_text(source)
+
+        # Pull company name to add it as a tag
+        company = _normalize_text(company)
+
+        published = fmt_date(published)
+
+        # Meta line shows ONLY Date • Source
+        meta_items = [p for p in [published, source] if p]
+        meta = " • ".join(meta_items)
+
+        excerpt = truncate(excerpt, excerpt_len) if has_excerpt else ""
+
+        topics = list(topics or [])
+        tags = list(tags or [])
+        countries = list(countries or [])
+
+        # Add Company Name to tags if it exists
+        if company and company not in tags:
+            tags.append(company)
+
+        excerpt_html = f'<div class="news-excerpt">{html.escape(excerpt)}</div>' if excerpt else ""
+
+        chips_html = ""
+        tchips = chip_row(topics)
+        if tchips:
+            chips_html += f'<div><span class="chip-label">Topics</span>{tchips}</div>'
+
+        xchips = chip_row(tags)
+        if xchips:
+            chips_html += f'<div><span class="chip-label">Tags</span>{xchips}</div>'
+
+        cchips = chip_row(countries)
+        if cchips:
+            chips_html += f'<div><span class="chip-label">Countries</span>{cchips}</div>'
+
+        # One line per card, no indentation: the cards are joined into a single markdown block, where
+        # indented lines would turn into code and blank lines would end the HTML block
+        cards.append(
+            f'<div class="news-card">{title_block}'
+            f'<div class="news-meta">{html.escape(meta)}</div>'
+            f"{excerpt_html}{chips_html}</div>"
+        )
+    return cards
+
+
 def main() -> None:
     st.set_page_config(page_title="Oil & Gas News Explorer", layout="wide")
     st.title("Oil & Gas News Explorer")
 
-    # Load sources (separate merged outputs)
-    jpt = load_csv(JPT_PATH)
-    wo = load_csv(WORLDOIL_PATH)
-    op = load_csv(OILPRICE_PATH)
+    data_token = tuple(_file_token(p) for p in (JPT_PATH, WORLDOIL_PATH, OILPRICE_PATH, ALL_TAGS_PATH))
+    df, banner = build_dataframe(data_token)
 
-    # Force source labels so neither “disappears”
-    if not jpt.empty:
-        jpt["source"] = "JPT"
-    if not wo.empty:
-        wo["source"] = "WorldOil"
-    if not op.empty:
-        op["source"] = "OilPrice"
-
-    df = pd.concat([jpt, wo, op], ignore_index=True)
-            
-    st.markdown(compute_last_updated_banner(jpt, wo, op))
+    st.markdown(banner)
 
     if df.empty:
         st.info("No data found yet. Make sure the CSVs exist and the workflows have run.")
         return
 
-    # Tag canonicalization
-    master_tags = load_master_tags(ALL_TAGS_PATH)
-    acronyms = build_acronym_set(master_tags)
-    canonical_map = build_canonical_tag_map(master_tags, acronyms)
-    country_set = build_country_set_cached()
-
-    # Detect columns (schema-tolerant)
-    col_title = pick_col(df, ["title", "headline"]) or "title"
-    col_url = pick_col(df, ["url", "link", "article_url"]) or "url"
-    col_source = "source"  # forced above
-    col_published = pick_col(df, ["published_date", "published", "date"])
-    col_scraped = pick_col(df, ["scraped_at"])
-    col_tags = pick_col(df, ["tags", "tag"]) or "tags"
-    col_topics = pick_col(df, ["topics", "topic"]) or "topics"
-    col_excerpt = pick_col(df, ["excerpt", "summary", "description", "deck", "teaser", "subtitle"])
-    col_company = pick_col(df, ["company_name", "company"])
-    col_meta = pick_col(df, ["meta_info"])
-
-    # Ensure minimal columns exist
-    ensure_column(df, col_title, "str")
-    ensure_column(df, col_url, "str")
-    ensure_column(df, col_source, "str")
-    ensure_column(df, col_tags, "list")
-    ensure_column(df, col_topics, "list")
-
-    # Parse list-like columns safely
-    df[col_tags] = df[col_tags].apply(_parse_listish)
-    df[col_topics] = df[col_topics].apply(_parse_listish)
-
-    # Normalize tags/topics PER ROW (no shared lists)
-    def normalize_tags_list(tags: List[str]) -> List[str]:
-        out: List[str] = []
-        for t in tags or []:
-            raw = _normalize_text(t)
-            if not raw:
-                continue
-            key = raw.lower()
-            if key in canonical_map:
-                out.append(canonical_map[key])
-            else:
-                out.append(normalize_phrase(raw, acronyms))
-
-        # dedupe preserve order
-        seen = set()
-        deduped: List[str] = []
-        for x in out:
-            if x not in seen:
-                seen.add(x)
-                deduped.append(x)
-        return deduped
-
-    def normalize_topics_list(topics: List[str]) -> List[str]:
-        out: List[str] = []
-        for t in topics or []:
-            raw = _normalize_text(t)
-            if raw:
-                out.append(normalize_phrase(raw, acronyms))
-        seen = set()
-        deduped: List[str] = []
-        for x in out:
-            if x not in seen:
-                seen.add(x)
-                deduped.append(x)
-        return deduped
-
-    df["tags_norm"] = df[col_tags].apply(normalize_tags_list)
-    df["topics_norm"] = df[col_topics].apply(normalize_topics_list)
-    df["countries"] = df["tags_norm"].apply(lambda xs: extract_countries_from_tags(xs, country_set))
-
-    df["source_norm"] = df[col_source].apply(
-        lambda x: normalize_phrase(_normalize_text(x), acronyms) if _normalize_text(x) else ""
-    )
-    df["title_norm"] = df[col_title].apply(lambda x: _normalize_text(x))
-
-    # --- Date Extraction Logic ---
-    df["published_dt"] = pd.to_datetime(df[col_published], errors="coerce") if col_published and col_published in df.columns else pd.NaT
-    
-    # Fallback: Extract from meta_info if published_dt is missing
-    if col_meta and col_meta in df.columns:
-        extracted_dates = df[col_meta].astype(str).str.extract(r"([A-Z][a-z]{2}\s\d{1,2},\s\d{4})")[0]
-        fallback_dt = pd.to_datetime(extracted_dates, errors="coerce")
-        df["published_dt"] = df["published_dt"].fillna(fallback_dt)
-        
-    df["scraped_dt"] = pd.to_datetime(df[col_scraped], errors="coerce") if col_scraped and col_scraped in df.columns else pd.NaT
-
-    if PREFER_JPT_ON_TIES:
-        # Give rank: JPT=0, WorldOil=1, OilPrice=2
-        df["_source_rank"] = df[col_source].map({"JPT": 0, "WorldOil": 1, "OilPrice": 2}).fillna(9).astype(int)
-    else:
-        df["_source_rank"] = 0
+    # Detect display columns (schema-tolerant)
+    col_url = pick_col(df, URL_CANDIDATES) or "url"
+    col_excerpt = pick_col(df, EXCERPT_CANDIDATES)
+    col_company = pick_col(df, COMPANY_CANDIDATES)
 
     # -------------------
     # Sidebar (order matters)
@@ -442,29 +861,18 @@ def main() -> None:
     default_sources = [s for s in DEFAULT_SOURCES if s in sources_all] or sources_all
 
     sel_sources = st.sidebar.multiselect("Sources", sources_all, default=default_sources)
-    filtered = df[df["source_norm"].isin(sel_sources)].copy()
-
-    # Ensure derived cols exist post-filter (safety)
-    for col, kind in [
-        ("tags_norm", "list"),
-        ("topics_norm", "list"),
-        ("countries", "list"),
-        ("title_norm", "str"),
-        ("source_norm", "str"),
-        ("published_dt", "dt"),
-        ("scraped_dt", "dt"),
-        ("_source_rank", "str"),  # harmless if missing
-    ]:
-        if col not in filtered.columns:
-            ensure_column(filtered, col, "list" if kind == "list" else ("dt" if kind == "dt" else "str"))
+    # Filters are positional bool masks over df (RangeIndex), ANDed together; the frame is
+    # only sliced once, after every mask is known
+    base_mask = df["source_norm"].isin(sel_sources).to_numpy()
 
     # --- Published date range (SAFE: doesn't remove rows without a date)
-    dt_series = pd.to_datetime(filtered["published_dt"], errors="coerce")
-    has_date = dt_series.notna()
+    dt_series = pd.to_datetime(df["published_dt"], errors="coerce")
+    has_date = dt_series.notna().to_numpy()
+    dated_in_view = dt_series[base_mask & has_date]
 
-    if has_date.any():
-        min_date = dt_series[has_date].min().date()
-        max_date = dt_series[has_date].max().date()
+    if not dated_in_view.empty:
+        min_date = dated_in_view.min().date()
+        max_date = dated_in_view.max().date()
 
         date_range = st.sidebar.date_input(
             "Published date range",
@@ -478,20 +886,29 @@ def main() -> None:
         else:
             start_date, end_date = min_date, max_date
 
-        filtered = filtered[(~has_date) | ((dt_series.dt.date >= start_date) & (dt_series.dt.date <= end_date))]
+        # Full span selected (the default): every dated row in view already passes
+        if (start_date, end_date) != (min_date, max_date):
+            # Compare on datetime64 directly (half-open day range) instead of materializing Python dates per row
+            lo = pd.Timestamp(start_date)
+            hi = pd.Timestamp(end_date) + pd.Timedelta(days=1)
+            base_mask &= ~has_date | ((dt_series >= lo) & (dt_series < hi)).to_numpy()
     else:
         st.sidebar.caption("Published date range: (no dates available)")
 
+    # Options come from the cached per-column label lists, restricted to rows still in view
+    indexes = build_filter_indexes(df, data_token)
+    in_view = base_mask
+
     topics_mode = st.sidebar.radio("Topics match mode", ["OR", "AND"], horizontal=True)
-    topics_all = sorted({t for row in filtered["topics_norm"] for t in (row or [])})
+    topics_all = available_values(indexes["topics_norm"], in_view)
     sel_topics = st.sidebar.multiselect("Topics", topics_all, default=[])
 
     tags_mode = st.sidebar.radio("Tags match mode", ["OR", "AND"], horizontal=True)
-    tags_all = sorted({t for row in filtered["tags_norm"] for t in (row or [])})
+    tags_all = available_values(indexes["tags_norm"], in_view)
     sel_tags = st.sidebar.multiselect("Tags", tags_all, default=[])
 
     countries_mode = st.sidebar.radio("Countries match mode", ["OR", "AND"], horizontal=True)
-    countries_all = sorted({c for row in filtered["countries"] for c in (row or [])})
+    countries_all = available_values(indexes["countries"], in_view)
     sel_countries = st.sidebar.multiselect("Countries", countries_all, default=[])
 
     q = st.sidebar.text_input("Search", value="").strip()
@@ -506,41 +923,24 @@ def main() -> None:
     # -------------------
     # Apply filters
     # -------------------
-    filtered = filtered[filtered["topics_norm"].apply(lambda xs: match_list(xs or [], sel_topics, topics_mode))]
-    filtered = filtered[filtered["tags_norm"].apply(lambda xs: match_list(xs or [], sel_tags, tags_mode))]
-    filtered = filtered[filtered["countries"].apply(lambda xs: match_list(xs or [], sel_countries, countries_mode))]
-
-    # Search (title + excerpt + company_name if exists)
+    keep = base_mask
+    for col, selected, mode in (
+        ("topics_norm", sel_topics, topics_mode),
+        ("tags_norm", sel_tags, tags_mode),
+        ("countries", sel_countries, countries_mode),
+    ):
+        if selected:  # an empty selection doesn't narrow anything
+            keep = keep & match_list_mask(indexes[col], selected, mode)
+
+    # Default view (nothing narrowed): skip the boolean take, which would copy the whole frame
+    filtered = df if keep.all() else df[keep]
+
+    # Search (title + excerpt + company_name if exists): one literal scan over the prebuilt haystack
     if q:
-        pattern = re.escape(q)
-        title_hit = filtered["title_norm"].fillna("").str.contains(pattern, case=False, na=False)
-
-        if col_excerpt and col_excerpt in filtered.columns:
-            excerpt_hit = filtered[col_excerpt].fillna("").astype(str).str.contains(pattern, case=False, na=False)
-        else:
-            excerpt_hit = pd.Series(False, index=filtered.index)
-            
-        company_hit = pd.Series(False, index=filtered.index)
-        if col_company and col_company in filtered.columns:
-            company_hit = filtered[col_company].fillna("").astype(str).str.contains(pattern, case=False, na=False)
+        filtered = filtered[filtered["_search_text"].str.contains(q.lower(), regex=False, na=False)]
 
-        filtered = filtered[title_hit | excerpt_hit | company_hit]
-
-    # Sort newest first (with optional JPT tie-breaker)
-    sort_cols: List[str] = []
-    ascending: List[bool] = []
-
-    sort_cols.append("published_dt")
-    ascending.append(False)
-
-    if PREFER_JPT_ON_TIES and "_source_rank" in filtered.columns:
-        sort_cols.append("_source_rank")
-        ascending.append(True)
-
-    sort_cols.append("scraped_dt")
-    ascending.append(False)
-
-    filtered = filtered.sort_values(by=sort_cols, ascending=ascending, kind="mergesort")
+    # Sort newest first (with optional JPT tie-breaker); only the visible page is gathered
+    order = newest_first_order(filtered)
 
     total = len(filtered)
     st.caption(f"Showing {total:,} results")
@@ -550,7 +950,7 @@ def main() -> None:
 
     start = (page - 1) * page_size
     end = start + page_size
-    page_df = filtered.iloc[start:end].copy()
+    page_df = filtered.take(order[start:end])
 
     # -------------------
     # Card UI styling
@@ -558,7 +958,6 @@ def main() -> None:
     st.markdown(
         """
         <style>
-          .news-wrap { max-width: 1150px; margin: 0 auto; }
           .news-card {
             border: 1px solid rgba(49, 51, 63, 0.2);
             border-radius: 14px;
@@ -609,72 +1008,11 @@ def main() -> None:
     # -------------------
     # Render cards
     # -------------------
-    st.markdown('<div class="news-wrap">', unsafe_allow_html=True)
-
-    for _, r in page_df.iterrows():
-        url = _normalize_text(r.get(col_url, ""))
-        title = _normalize_text(r.get("title_norm", "")) or "Untitled"
-        source = _normalize_text(r.get("source_norm", ""))
-        
-        # Pull company name to add it as a tag
-        company = _normalize_text(r.get(col_company, "")) if col_company and col_company in page_df.columns else ""
-
-        published = fmt_date(r.get("published_dt", None))
-        
-        # Meta line shows ONLY Date • Source
-        meta_items = [p for p in [published, source] if p]
-        meta = " • ".join(meta_items)
-
-        excerpt = ""
-        if show_excerpt and col_excerpt and col_excerpt in page_df.columns:
-            excerpt = truncate(r.get(col_excerpt, ""), excerpt_len)
-
-        topics = list(r.get("topics_norm", []) or [])
-        tags = list(r.get("tags_norm", []) or [])
-        countries = list(r.get("countries", []) or [])
-
-        # Add Company Name to tags if it exists
-        if company and company not in tags:
-            tags.append(company)
-
-        title_html = html.escape(title)
-        if url:
-            url_html = html.escape(url)
-            title_block = (
-                f'<div class="news-title"><a href="{url_html}" target="_blank" rel="noopener noreferrer">'
-                f"{title_html}</a></div>"
-            )
-        else:
-            title_block = f'<div class="news-title">{title_html}</div>'
-
-        excerpt_html = f'<div class="news-excerpt">{html.escape(excerpt)}</div>' if excerpt else ""
-
-        chips_html = ""
-        tchips = chip_row(topics)
-        if tchips:
-            chips_html += f'<div><span class="chip-label">Topics</span>{tchips}</div>'
-        
-        xchips = chip_row(tags)
-        if xchips:
-            chips_html += f'<div><span class="chip-label">Tags</span>{xchips}</div>'
-            
-        cchips = chip_row(countries)
-        if cchips:
-            chips_html += f'<div><span class="chip-label">Countries</span>{cchips}</div>'
-
-        st.markdown(
-            f"""
-            <div class="news-card">
-              {title_block}
-              <div class="news-meta">{html.escape(meta)}</div>
-              {excerpt_html}
-              {chips_html}
-            </div>
-            """,
-            unsafe_allow_html=True,
-        )
-
-    st.markdown("</div>", unsafe_allow_html=True)
+    # The whole page goes out as one markdown element (one protocol message). No width wrapper:
+    # cards keep the full main-column width they have always rendered at
+    page_key = (data_token, tuple(page_df.index))
+    cards = render_page_cards(page_df, page_key, col_url, col_excerpt, col_company, show_excerpt, excerpt_len)
+    st.markdown("\n".join(cards), unsafe_allow_html=True)
 
 
 if __name__ == "__main__":
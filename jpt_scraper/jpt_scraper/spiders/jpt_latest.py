@@ -2,11 +2,11 @@ from __future__ import annotations
 
 import csv
 import re
-from datetime import datetime, timezone
+from datetime import date, datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 
 import scrapy
-from dateutil import parser as dateparser
 
 from jpt_scraper.items import JptScraperItem
 
@@ -14,31 +14,40 @@ BASE = "https://jpt.spe.org"
 START_URL = f"{BASE}/latest-news"
 
 MONTH_DATE_RE = re.compile(
-    r"\b(January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{1,2},\s+\d{4}\b"
+    r"\b(January|February|March|April|May|June|July|August|September|October|November|December)\s+(\d{1,2}),\s+(\d{4})\b"
 )
+MONTHS = {
+    "January": 1, "February": 2, "March": 3, "April": 4, "May": 5, "June": 6,
+    "July": 7, "August": 8, "September": 9, "October": 10, "November": 11, "December": 12,
+}
 
+# Collapse whitespace runs in one C-level pass
+_WS_RE = re.compile(r"\s+")
 
+
+@lru_cache(maxsize=4096)
 def parse_date_from_text(text: str) -> str | None:
     """Extracts 'Month D, YYYY' from text and returns 'YYYY-MM-DD'."""
     m = MONTH_DATE_RE.search(text or "")
     if not m:
         return None
+    # Groups are already (month name, day, year): no general-purpose date parser needed
     try:
-        dt = dateparser.parse(m.group(0))
-        return dt.date().isoformat()
-    except Exception:
+        return date(int(m.group(3)), MONTHS[m.group(1)], int(m.group(2))).isoformat()
+    except ValueError:  # e.g. "February 30, 2024"
         return None
 
 
+@lru_cache(maxsize=4096)
+def _clean_token(x) -> str:
+    # Raw /topic/ and /tag/ anchor texts from the article tag container; a small set of JPT
+    # discipline topics ("Business/economics", "Environment", ...) recurs across most articles
+    return _WS_RE.sub(" ", str(x)).strip()
+
+
 def clean_list(xs) -> list[str]:
-    out: list[str] = []
-    seen: set[str] = set()
-    for x in xs or []:
-        x = " ".join(str(x).split()).strip()
-        if x and x not in seen:
-            out.append(x)
-            seen.add(x)
-    return out
+    # Ordered dedupe in one pass: dicts keep first-seen order
+    return list(dict.fromkeys(x for x in map(_clean_token, xs or []) if x))
 
 
 def read_last_date_from_csv(csv_path: str | None) -> str | None:
@@ -55,9 +64,11 @@ def read_last_date_from_csv(csv_path: str | None) -> str | None:
 
     try:
         with path.open(newline="", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-            dates = [r.get("published_date") for r in reader if r.get("published_date")]
-        return max(dates) if dates else None
+            # Running max over the stream: no list of every date in MASTER
+            return max(
+                (d for r in csv.DictReader(f) if (d := r.get("published_date"))),
+                default=None,
+            )
     except Exception:
         return None
 
@@ -121,8 +132,8 @@ class JptLatestSpider(scrapy.Spider):
                 continue
             url = response.urljoin(href)
 
-            title = " ".join((promo.css("div.PromoB-title a::text").get() or "").split())
-            excerpt = " ".join((promo.css("div.PromoB-description::text").get() or "").split())
+            title = _WS_RE.sub(" ", promo.css("div.PromoB-title a::text").get() or "").strip()
+            excerpt = _WS_RE.sub(" ", promo.css("div.PromoB-description::text").get() or "").strip()
 
             byline_text = " ".join(
                 promo.css("div.PromoB-by-line::text, div.PromoB-by-line *::text").getall()
@@ -141,7 +152,7 @@ class JptLatestSpider(scrapy.Spider):
             yield response.follow(
                 url,
                 callback=self.parse_article,
-                meta={
+                cb_kwargs={
                     "url": url,
                     "title": title,
                     "excerpt": excerpt,
@@ -155,12 +166,14 @@ class JptLatestSpider(scrapy.Spider):
             if next_href:
                 yield response.follow(next_href, callback=self.parse)
 
-    def parse_article(self, response: scrapy.http.Response):
-        url = response.meta["url"]
-        title = response.meta.get("title") or ""
-        excerpt = response.meta.get("excerpt") or ""
-        published_date = response.meta["published_date"]
-
+    def parse_article(
+        self,
+        response: scrapy.http.Response,
+        url: str,
+        published_date: str,
+        title: str = "",
+        excerpt: str = "",
+    ):
         container = response.css("div.ArticlePage-tags-container")
 
         topics = container.xpath(
@@ -181,8 +194,8 @@ class JptLatestSpider(scrapy.Spider):
 
         yield JptScraperItem(
             url=url,
-            title=title,
-            excerpt=excerpt,
+            title=title or "",
+            excerpt=excerpt or "",
             published_date=published_date,
             topics=clean_list(topics),
             tags=clean_list(tags),
@@ -2,12 +2,12 @@ from __future__ import annotations
 
 import os
 import re
-from datetime import datetime, timezone
+from datetime import date, datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 
 import scrapy
 from scrapy.crawler import CrawlerProcess
-from dateutil import parser as dateparser
 
 # -------------------
 # PATHS & CONFIG
@@ -23,15 +23,23 @@ MAX_PAGES = int(os.getenv("MAX_PAGES", "10"))
 # HELPERS
 # -------------------
 # Matches dates like "Feb 26, 2026"
-DATE_RE = re.compile(r"([A-Z][a-z]{2}\s\d{1,2},\s\d{4})")
+DATE_RE = re.compile(r"([A-Z][a-z]{2})\s(\d{1,2}),\s(\d{4})")
+MONTH_ABBR = {
+    "Jan": 1, "Feb": 2, "Mar": 3, "Apr": 4, "May": 5, "Jun": 6,
+    "Jul": 7, "Aug": 8, "Sep": 9, "Oct": 10, "Nov": 11, "Dec": 12,
+}
 
+# Collapse whitespace runs in one C-level pass
+_WS_RE = re.compile(r"\s+")
+
+@lru_cache(maxsize=4096)
 def parse_date(text: str) -> str | None:
     m = DATE_RE.search(text or "")
-    if not m:
+    if not m or m.group(1) not in MONTH_ABBR:
         return None
     try:
-        return dateparser.parse(m.group(1)).date().isoformat()
-    except Exception:
+        return date(int(m.group(3)), MONTH_ABBR[m.group(1)], int(m.group(2))).isoformat()
+    except ValueError:  # e.g. "Feb 30, 2026"
         return None
 
 # -------------------
@@ -65,7 +73,7 @@ class OilPriceSpider(scrapy.Spider):
                     "company_name": company_name.strip(),
                     "title": title.strip() if title else "",
                     "url": response.urljoin(link) if link else "",
-                    "excerpt": " ".join((excerpt or "").split()).strip(),
+                    "excerpt": _WS_RE.sub(" ", excerpt or "").strip(),
                     "published_date": parse_date(meta_info),
                     "scraped_at": datetime.now(timezone.utc).isoformat(),
                 }
@@ -1,11 +1,11 @@
 from __future__ import annotations
 
 import re
-from datetime import datetime, timezone
+from datetime import date, datetime, timezone
+from functools import lru_cache
 from typing import Iterable
 
 import scrapy
-from dateutil import parser as dateparser
 
 from jpt_scraper.items import JptScraperItem
 
@@ -22,50 +22,57 @@ START_URLS = [
 ]
 
 MONTH_DATE_RE = re.compile(
-    r"\b(January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{1,2},\s+\d{4}\b"
+    r"\b(January|February|March|April|May|June|July|August|September|October|November|December)\s+(\d{1,2}),\s+(\d{4})\b"
 )
+MONTHS = {
+    "January": 1, "February": 2, "March": 3, "April": 4, "May": 5, "June": 6,
+    "July": 7, "August": 8, "September": 9, "October": 10, "November": 11, "December": 12,
+}
+
+# Collapse whitespace runs in one C-level pass
+_WS_RE = re.compile(r"\s+")
 
-TOPIC_WHITELIST = {
+TOPIC_WHITELIST = frozenset({
     "Onshore",
     "Offshore",
     "Digital Transformation",
     "Energy Transition",
     "Industry & Analysis",
-}
+})
 
 # Optional: add a "Company News" topic label for /company-news items
 COMPANY_NEWS_LABEL = "Company News"
 
 
+@lru_cache(maxsize=4096)
 def parse_date(text: str) -> str | None:
     m = MONTH_DATE_RE.search(text or "")
     if not m:
         return None
+    # Groups are already (month name, day, year): no general-purpose date parser needed
     try:
-        return dateparser.parse(m.group(0)).date().isoformat()
-    except Exception:
+        return date(int(m.group(3)), MONTHS[m.group(1)], int(m.group(2))).isoformat()
+    except ValueError:  # e.g. "February 30, 2024"
         return None
 
 
+@lru_cache(maxsize=4096)
+def _clean_token(x) -> str:
+    # Same labels ("Onshore", ...) recur on every page
+    return _WS_RE.sub(" ", str(x)).strip()
+
+
 def clean_list(xs) -> list[str]:
-    out = []
-    seen = set()
-    for x in xs or []:
-        x = " ".join(str(x).split()).strip()
-        if x and x not in seen:
-            out.append(x)
-            seen.add(x)
-    return out
+    # Ordered dedupe in one pass: dicts keep first-seen order
+    return list(dict.fromkeys(x for x in map(_clean_token, xs or []) if x))
 
 
 def split_topics_tags(labels: list[str]) -> tuple[list[str], list[str]]:
     topics, tags = [], []
+    # clean_list already cleaned and deduped: each half is final as built
     for x in clean_list(labels):
-        if x in TOPIC_WHITELIST:
-            topics.append(x)
-        else:
-            tags.append(x)
-    return clean_list(topics), clean_list(tags)
+        (topics if x in TOPIC_WHITELIST else tags).append(x)
+    return topics, tags
 
 
 def add_topic(topics: list[str], t: str) -> list[str]:
@@ -140,7 +147,7 @@ class WorldOilNewsSpider(scrapy.Spider):
             yield response.follow(
                 url,
                 callback=self.parse_article,
-                meta={
+                cb_kwargs={
                     "url": url,
                     "title": title,
                     "published_date": published_date,
@@ -161,24 +168,26 @@ class WorldOilNewsSpider(scrapy.Spider):
             if next_href:
                 yield response.follow(next_href, callback=self.parse)
 
-    def parse_article(self, response: scrapy.http.Response):
-        url = response.meta["url"]
-        title = response.meta.get("title") or ""
-        published_date = response.meta["published_date"]
-        topics = response.meta.get("topics") or []
-        tags = response.meta.get("tags") or []
-
+    def parse_article(
+        self,
+        response: scrapy.http.Response,
+        url: str,
+        published_date: str,
+        title: str = "",
+        topics: list[str] | None = None,
+        tags: list[str] | None = None,
+    ):
         excerpt = response.css('meta[name="description"]::attr(content)').get() or ""
-        excerpt = " ".join(excerpt.split()).strip()
+        excerpt = _WS_RE.sub(" ", excerpt).strip()
 
         if not excerpt:
             p = response.css("article p::text, .article p::text, .content p::text").get()
-            excerpt = " ".join((p or "").split()).strip()
+            excerpt = _WS_RE.sub(" ", p or "").strip()
 
         yield JptScraperItem(
             source="worldoil",
             url=url,
-            title=title,
+            title=title or "",
             excerpt=excerpt,
             published_date=published_date,
             topics=clean_list(topics),
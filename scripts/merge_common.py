@@ -0,0 +1,133 @@
+"""
+DAILY merge step shared by the merge_*_three_way.py scripts.
+
+DAILY is merged onto the previous merged output (e.g. jpt.csv), which is the base on every
+run; MASTER is only read to seed the first run, when no merged output exists yet.
+"""
+from __future__ import annotations
+
+import csv
+import filecmp
+import os
+from pathlib import Path
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pv
+
+# Row takes / sorts on DAILY share buffers until written (pandas 3 default)
+pd.set_option("mode.copy_on_write", True)
+
+
+def load_csv(path: Path, label: str) -> pd.DataFrame:
+    if not path.exists():
+        print(f"{label} not found: {path} (using empty)")
+        return pd.DataFrame()
+    # Arrow's multithreaded reader; every column stays text so values round-trip untouched
+    header = pd.read_csv(path, nrows=0).columns
+    table = pv.read_csv(
+        path,
+        convert_options=pv.ConvertOptions(
+            column_types={c: pa.string() for c in header},
+            strings_can_be_null=True,
+        ),
+    )
+    df = table.to_pandas()
+    print(f"{label} loaded: {len(df)} rows")
+    return df
+
+
+def read_header(path: Path) -> list[str]:
+    if not path.exists():
+        return []
+    with path.open(newline="", encoding="utf-8") as f:
+        return next(csv.reader(f), [])
+
+
+def fsync_dir(path: Path) -> None:
+    """Make a rename inside directory `path` durable; skipped where directories can't be opened (Windows)."""
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def merge_three_way(master_csv: Path, daily_csv: Path, merged_csv: Path) -> None:
+    """Previous merged CSV (MASTER on the first run) + DAILY -> merged CSV; DAILY wins on URL conflicts."""
+    # Accumulate onto the last merged output, so rows that age out of the DAILY window are
+    # kept; MASTER only seeds the first run (or a rebuild after deleting the merged file)
+    base_csv, base_label = (merged_csv, "MERGED") if merged_csv.exists() else (master_csv, "MASTER")
+
+    # DAILY is small: load it whole. The base is only ever streamed.
+    daily_df = load_csv(daily_csv, "DAILY")
+    base_cols = read_header(base_csv)
+
+    if not base_cols and daily_df.empty:
+        raise RuntimeError(f"Both {base_label} and DAILY are empty. Nothing to merge.")
+
+    for name, cols in [(base_label, base_cols), ("DAILY", list(daily_df.columns))]:
+        if cols and "url" not in cols:
+            raise ValueError(f"{name} CSV missing required 'url' column.")
+
+    # Nothing to add onto the previous merged output: it is already the result, skip rewriting it
+    if base_csv == merged_csv and daily_df.empty and set(daily_df.columns) <= set(base_cols):
+        print(f"No changes: {merged_csv}")
+        return
+
+    # Latest scrape per URL in one hash pass (ISO-8601 strings compare chronologically)
+    if "scraped_at" in daily_df.columns:
+        latest = daily_df["scraped_at"].fillna("").groupby(daily_df["url"], sort=False, dropna=False).idxmax()
+        daily_df = daily_df.loc[latest]
+    elif not daily_df.empty:
+        daily_df = daily_df.drop_duplicates(subset=["url"], keep="last")
+
+    # Newest first within DAILY
+    if "published_date" in daily_df.columns:
+        sort_cols = ["published_date"] + (["scraped_at"] if "scraped_at" in daily_df.columns else [])
+        daily_df = daily_df.sort_values(sort_cols, ascending=False, kind="mergesort")
+    elif "scraped_at" in daily_df.columns:
+        daily_df = daily_df.sort_values("scraped_at", ascending=False, kind="mergesort")
+
+    fieldnames = base_cols + [c for c in daily_df.columns if c not in base_cols]
+    seen = set(daily_df["url"]) if not daily_df.empty else set()
+    base_kept = 0
+
+    # Rows go out as plain sequences (no per-row dicts): DAILY column-wise, with None
+    # (written as "") for base-only columns; base rows as read, padded for DAILY-only ones
+    daily_cols = [daily_df[c].tolist() if c in daily_df.columns else [None] * len(daily_df) for c in fieldnames]
+    pad = [""] * (len(fieldnames) - len(base_cols))
+
+    # Atomic write (merged only): DAILY rows, then base rows DAILY doesn't supersede
+    tmp = merged_csv.with_suffix(".csv.tmp")
+    with tmp.open("w", newline="", encoding="utf-8") as out:
+        writer = csv.writer(out, lineterminator="\n")
+        writer.writerow(fieldnames)
+        writer.writerows(zip(*daily_cols))
+        if base_cols:
+            url_idx = base_cols.index("url")
+            with base_csv.open(newline="", encoding="utf-8") as f:
+                reader = csv.reader(f)
+                next(reader)  # header, already in fieldnames
+                for row in reader:
+                    if not row or row[url_idx] in seen:
+                        continue
+                    seen.add(row[url_idx])
+                    writer.writerow(row + pad)
+                    base_kept += 1
+        # The merged file is the next run's base: its bytes must be on disk before the rename
+        out.flush()
+        os.fsync(out.fileno())
+
+    # Nothing new: leave the merged file (and its mtime, which keys the app's caches) alone
+    if merged_csv.exists() and filecmp.cmp(tmp, merged_csv, shallow=False):
+        tmp.unlink()
+        print(f"No changes: {merged_csv}")
+    else:
+        tmp.replace(merged_csv)
+        fsync_dir(merged_csv.parent)
+        print(f"Merged written: {merged_csv}")
+    print(f"Rows: {len(daily_df) + base_kept} | Unique URLs: {len(seen)}")
@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+from scrape_common import crawl_daily
+
+
+# -------------------
+# PATHS
+# -------------------
+SCRIPTS_DIR = Path(__file__).resolve().parent
+REPO_ROOT = SCRIPTS_DIR.parent
+
+SCRAPY_ROOT = REPO_ROOT / "jpt_scraper"
+DATA_DIR = SCRAPY_ROOT / "data"
+
+# -------------------
+# CONFIG
+# -------------------
+# (spider, daily CSV) for every source; same outputs as the scrape_*_new.py scripts
+JOBS = [
+    ("jpt_latest", DATA_DIR / "jpt_daily.csv"),
+    ("worldoil_latest", DATA_DIR / "worldoil_daily.csv"),
+    ("oilprice_company_news", DATA_DIR / "oilprice_daily.csv"),
+]
+MAX_PAGES = int(os.getenv("MAX_PAGES", "10"))
+
+
+def main() -> None:
+    DATA_DIR.mkdir(parents=True, exist_ok=True)
+
+    for _, daily_csv in JOBS:
+        if daily_csv.exists():
+            daily_csv.unlink()
+
+    print("--- Scrape step (daily only, all sources concurrently) ---")
+    print(f"Scrapy root: {SCRAPY_ROOT}")
+    print(f"MAX_PAGES:   {MAX_PAGES}")
+    for spider_name, daily_csv in JOBS:
+        print(f"{spider_name:<22} -> {daily_csv}")
+
+    crawl_daily(JOBS, MAX_PAGES)
+
+
+if __name__ == "__main__":
+    main()
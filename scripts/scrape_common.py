@@ -0,0 +1,54 @@
+"""In-process Scrapy runner shared by the scrape_*_new.py scripts."""
+from __future__ import annotations
+
+import os
+import sys
+from pathlib import Path
+
+from scrapy.crawler import CrawlerProcess
+from scrapy.utils.project import get_project_settings
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+SCRAPY_ROOT = SCRIPTS_DIR.parent / "jpt_scraper"
+
+
+def crawl_daily(jobs: list[tuple[str, Path]], max_pages: int) -> None:
+    """
+    Runs each (spider name, daily CSV) job in one CrawlerProcess, all concurrently: the crawls are
+    network-bound and independent, so the run takes as long as the slowest spider, not the sum.
+    """
+    # Same as `scrapy crawl -O` from the project dir, minus a second interpreter + Scrapy/Twisted import
+    sys.path.insert(0, str(SCRAPY_ROOT))
+    os.environ.setdefault("SCRAPY_SETTINGS_MODULE", "jpt_scraper.settings")
+    settings = get_project_settings()
+    # Each spider gets its output path as the `daily_csv` attribute, filled into the feed URI
+    settings.set("FEEDS", {"%(daily_csv)s": {"format": "csv", "overwrite": True}})
+
+    process = CrawlerProcess(settings)
+    crawlers = []
+    errors: dict[int, str] = {}  # job index -> crawl error
+
+    def record_error(failure, job: int) -> None:
+        errors[job] = failure.getErrorMessage()
+
+    for i, (spider_name, daily_csv) in enumerate(jobs):
+        crawler = process.create_crawler(spider_name)
+        d = process.crawl(crawler, max_pages=max_pages, daily_csv=str(daily_csv))
+        # Startup errors after the spider exists (engine, middlewares, handlers) only surface here;
+        # process.bootstrap_failed doesn't see them
+        d.addErrback(record_error, i)
+        crawlers.append(crawler)
+    process.start()
+
+    # Every job is checked on its own: one source failing must fail the step even if the others
+    # finished (`scrapy crawl` would have exited non-zero), instead of merging without its DAILY
+    failed = []
+    for i, (crawler, (spider_name, daily_csv)) in enumerate(zip(crawlers, jobs)):
+        stats = getattr(crawler, "stats", None)
+        reason = stats.get_value("finish_reason") if stats else None
+        ok = i not in errors and reason == "finished" and daily_csv.exists()
+        print(f"{spider_name:<22} {'OK' if ok else 'FAILED'} (finish_reason={reason}, output exists={daily_csv.exists()})")
+        if not ok:
+            failed.append(f"{spider_name}: {errors.get(i, f'finish_reason={reason}')}")
+    if failed:
+        raise RuntimeError(f"{len(failed)} of {len(jobs)} scrape job(s) failed: {'; '.join(failed)}")
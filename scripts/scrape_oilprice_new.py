@@ -1,9 +1,10 @@
 from __future__ import annotations
 
 import os
-import subprocess
 from pathlib import Path
 
+from scrape_common import crawl_daily
+
 # -------------------
 # PATHS
 # -------------------
@@ -35,17 +36,7 @@ def main() -> None:
     print(f"MAX_PAGES:   {MAX_PAGES}")
     print(f"Output:      {DAILY_CSV}")
 
-    cmd = [
-        "scrapy",
-        "crawl",
-        SPIDER_NAME,
-        "-a",
-        f"max_pages={MAX_PAGES}",
-        "-O",
-        str(DAILY_CSV),
-    ]
-
-    subprocess.run(cmd, cwd=str(SCRAPY_ROOT), check=True)
+    crawl_daily([(SPIDER_NAME, DAILY_CSV)], MAX_PAGES)
 
 
 if __name__ == "__main__":